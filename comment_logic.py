@@ -0,0 +1,294 @@
+# comment_logic.py
+import re
+from enum import IntEnum
+
+# --- Comment Removal Logic ---
+
+class Lang(IntEnum):
+    PYTHON = 0
+    C_LIKE = 1
+    HTML = 2
+    SQL = 3
+    LUA = 4
+
+# Display names, indexed by Lang
+LANGUAGES = ('Python', 'C/C++/Java/C#/JavaScript/Rust', 'HTML/XML', 'SQL', 'Lua')
+LANGUAGE_IDS = {name: Lang(i) for i, name in enumerate(LANGUAGES)}
+
+def _combined_re(marker, multi_line):
+    # Block and line comments in one alternation. A line holding only a
+    # comment is dropped together with the newline in front of it; on the
+    # first line, or after a block comment, the caller drops it the way the
+    # scanner does. Every branch starts with a literal, which lets the regex
+    # engine skip ahead to candidate positions, so blanks in front of a
+    # trailing comment are trimmed by the caller too. The empty 'trailing'
+    # group marks that branch; it sits after the marker because a group at
+    # the start of a branch disables the skipping.
+    # The lookahead keeps Lua's '--[[' from being read as a line comment.
+    block = multi_line.pattern
+    marker = re.escape(marker)
+    return re.compile(rf'{block}|\n[^\S\n]*(?!{block}){marker}[^\n]*|{marker}(?P<trailing>)[^\n]*')
+
+# Comment markers of the languages stripped with regexes; Python and
+# C-like code goes through the scanner instead
+COMMENT_MARKERS = {
+    Lang.HTML: {
+        'multi_line': ('<!--', '-->')
+    },
+    Lang.SQL: {
+        'single_line': '--',
+        'multi_line': ('/*', '*/')
+    },
+    Lang.LUA: {
+        'single_line': '--',
+        'multi_line': ('--[[', ']]')
+    }
+}
+
+def _block_re(start, end):
+    return re.compile(rf'{re.escape(start)}[\s\S]*?{re.escape(end)}')
+
+# Block comment patterns built from those markers
+PATTERNS = {
+    lang: {'multi_line': _block_re(*markers['multi_line'])}
+    for lang, markers in COMMENT_MARKERS.items()
+}
+
+def _scanner(line_marker, blocks, quotes, multiline_quotes='', char_quote=None):
+    """
+    Builds the searches CommentRemoverLogic._scan needs for one language.
+    A string opened by one of `quotes` ends at its closing quote or at an
+    unescaped newline, unless its quote is listed in `multiline_quotes`.
+    `char_quote` only opens a literal the size of one (escaped) character,
+    such as 'a' or '\\n'; otherwise it is plain code, like a Rust
+    lifetime ('a) or a quote inside a JavaScript regex literal.
+    """
+    tokens = [re.escape(start) for start, _ in blocks]
+    if line_marker:
+        tokens.append(re.escape(line_marker))
+    if quotes:
+        tokens.append(f'[{re.escape(quotes)}]')
+    char_re = None
+    if char_quote:
+        q = re.escape(char_quote)
+        tokens.append(q)
+        char_re = re.compile(
+            rf'{q}(?:\\(?:x[0-9A-Fa-f]+|u\{{[0-9A-Fa-f]+\}}|u[0-9A-Fa-f]{{4}}|[^\n])|[^\\{q}\n]){q}'
+        )
+    return {
+        'line_marker': line_marker,
+        'block_ends': dict(blocks),
+        'token_re': re.compile('|'.join(tokens)),
+        'string_end_res': {
+            quote: re.compile(rf'[\\{re.escape(quote)}]' if quote in multiline_quotes
+                              else rf'[\\\n{re.escape(quote)}]')
+            for quote in quotes
+        },
+        'char_quote': char_quote,
+        'char_re': char_re
+    }
+
+_PYTHON_SCANNER = _scanner('#', (('"""', '"""'), ("'''", "'''")), '"\'')
+_C_LIKE_SCANNER = _scanner('//', (('/*', '*/'),), '"`', multiline_quotes='`', char_quote="'")
+
+# Same patterns as a tuple, indexed by Lang; None for scanned languages
+PATTERNS_BY_ID = tuple(PATTERNS.get(lang) for lang in Lang)
+
+# File extension (without the leading dot) to language mapping
+EXTENSION_MAP = {
+    'py': Lang.PYTHON, 'pyw': Lang.PYTHON,
+    'c': Lang.C_LIKE, 'cpp': Lang.C_LIKE,
+    'h': Lang.C_LIKE, 'hpp': Lang.C_LIKE,
+    'java': Lang.C_LIKE, 'cs': Lang.C_LIKE,
+    'js': Lang.C_LIKE, 'ts': Lang.C_LIKE,
+    'rs': Lang.C_LIKE,
+    'html': Lang.HTML, 'htm': Lang.HTML, 'xml': Lang.HTML,
+    'sql': Lang.SQL,
+    'lua': Lang.LUA
+}
+
+class CommentRemoverLogic:
+    """
+    Class containing logic for removing comments for different languages.
+    Python and C-like code is stripped by a single-pass scanner that leaves
+    string literals untouched. HTML/XML has no strings or line comments to
+    protect, so its comments are removed with a single regex.
+    NOTE: SQL and Lua still use the regex-based system, which may have
+    issues with comments inside string literals (e.g., "-- not a comment").
+    The C-like scanner only treats ' as a char literal quote, so comment
+    markers inside single-quoted JavaScript strings are not protected
+    (e.g., 'http://x'). However, it is sufficient for most cases.
+    """
+    def __init__(self):
+        self.patterns = PATTERNS_BY_ID
+        self.extension_map = EXTENSION_MAP
+        # Dedicated stripper per language; the others use the regex path
+        strippers = {
+            Lang.PYTHON: self._strip_python,
+            Lang.C_LIKE: self._strip_c_like,
+            Lang.HTML: self._strip_html
+        }
+        self._strippers = tuple(strippers.get(lang) for lang in Lang)
+        # Line and block comment markers of the regex-path languages, indexed
+        # by Lang (None elsewhere); every match starts with one of them, so
+        # code containing neither is not searched at all
+        self._markers = tuple(
+            None if lang in strippers
+            else (COMMENT_MARKERS[lang]['single_line'], COMMENT_MARKERS[lang]['multi_line'][0])
+            for lang in Lang
+        )
+        # Those languages strip both comment kinds in one pass
+        self._combined_patterns = tuple(
+            None if markers is None else _combined_re(markers[0], self.patterns[language]['multi_line'])
+            for language, markers in zip(Lang, self._markers)
+        )
+
+    def get_language_from_filename(self, filename):
+        _, dot, ext = filename.rpartition('.')
+        if not dot:
+            return Lang.PYTHON
+        return self.extension_map.get(ext.lower(), Lang.PYTHON) # Domyślnie Python
+
+    def remove_comments(self, code, language):
+        stripper = self._strippers[language]
+        if stripper is not None:
+            processed_code = stripper(code)
+        else:
+            processed_code = self._remove_with_patterns(code, language)
+
+        # Collapse runs of blank lines; every pass shortens each run by a third
+        while '\n\n\n' in processed_code:
+            processed_code = processed_code.replace('\n\n\n', '\n\n')
+        
+        return processed_code.strip()
+
+    def _remove_with_patterns(self, code, language):
+        if not any(marker in code for marker in self._markers[language]):
+            return code
+
+        pieces = []
+        pos = 0
+        for match in self._combined_patterns[language].finditer(code):
+            kept = code[pos:match.start()]
+            pos = match.end()
+            if match.lastgroup == 'trailing':
+                if kept.strip():
+                    kept = kept.rstrip(' \t')
+                else:
+                    # Only blanks (and removed block comments) in front of it
+                    # on this line, or it is the first line
+                    pieces.append(kept)
+                    if self._drop_blank_line_start(pieces):
+                        if code.startswith('\n', pos):
+                            pos += 1
+                    else:
+                        self._trim_line_end(pieces)
+                    continue
+            pieces.append(kept)
+        pieces.append(code[pos:])
+        return ''.join(pieces)
+
+    def _strip_python(self, code):
+        return self._scan(code, _PYTHON_SCANNER)
+
+    def _strip_c_like(self, code):
+        return self._scan(code, _C_LIKE_SCANNER)
+
+    def _strip_html(self, code):
+        # No strings or line comments to protect, a single regex pass will do
+        return self.patterns[Lang.HTML]['multi_line'].sub('', code)
+
+    def _scan(self, code, scanner):
+        """
+        Removes comments in a single forward pass over the code, using the
+        precompiled searches of a scanner built by _scanner().
+        String literals are copied verbatim, so comment markers inside them
+        are kept. Unterminated block comments are left as they are.
+        Plain code between markers, newlines included, is located with
+        compiled searches and copied in slices, so the loop runs once per
+        comment or literal, not per character or line.
+        """
+        line_marker = scanner['line_marker']
+        block_ends = scanner['block_ends']
+        token_re = scanner['token_re']
+        string_end_res = scanner['string_end_res']
+        char_quote = scanner['char_quote']
+        char_re = scanner['char_re']
+
+        out = []
+        i, n = 0, len(code)
+        while i < n:
+            match = token_re.search(code, i)
+            if match is None:
+                out.append(code[i:])
+                break
+            token_start, i = match.span()
+            out.append(code[match.pos:token_start])
+            token = match.group()
+
+            if token in block_ends:
+                close = code.find(block_ends[token], i)
+                if close < 0:
+                    out.append(token)
+                else:
+                    i = close + len(block_ends[token])
+            elif token == line_marker:
+                i = code.find('\n', i)
+                if i < 0:
+                    i = n
+                elif self._drop_blank_line_start(out):
+                    # Comment-only line: its newline goes along with it
+                    i += 1
+                else:
+                    out[-1] = out[-1].rstrip(' \t')
+                    if not out[-1]:
+                        self._trim_line_end(out)
+            elif token == char_quote:
+                literal = char_re.match(code, token_start)
+                if literal is not None:
+                    i = literal.end()
+                out.append(code[token_start:i])
+            else:
+                string_end_re = string_end_res[token]
+                while True:
+                    end = string_end_re.search(code, i)
+                    if end is None:
+                        i = n
+                        break
+                    i = end.end()
+                    if end.group() == '\\':
+                        i += 1
+                        continue
+                    if end.group() == '\n':
+                        i -= 1
+                    break
+                out.append(code[token_start:i])
+
+        return ''.join(out)
+
+    @staticmethod
+    def _drop_blank_line_start(out):
+        # Called when a line comment starts: looks back to the last newline
+        # in the output and, if only blanks follow it, removes them so the
+        # whole line disappears (like the regex path). Returns whether it did.
+        for k in range(len(out) - 1, -1, -1):
+            piece = out[k]
+            newline = piece.rfind('\n')
+            if piece[newline + 1:].strip():
+                return False
+            if newline >= 0:
+                out[k] = piece[:newline + 1]
+                del out[k + 1:]
+                return True
+        out.clear()
+        return True
+
+    @staticmethod
+    def _trim_line_end(out):
+        # Called when the piece in front of a trailing line comment was all
+        # blanks: a removed block comment can split them over several pieces
+        # (e.g. "a /* x */ // y"), so keep stripping until real code shows up.
+        for k in range(len(out) - 1, -1, -1):
+            out[k] = out[k].rstrip(' \t')
+            if out[k]:
+                return
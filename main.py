@@ -1,92 +1,19 @@
 # main.py
 import sys
-import re
 import os
 import json
+import mmap
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QPushButton, QFileDialog, QComboBox, QLabel,
+    QPlainTextEdit, QPushButton, QFileDialog, QComboBox, QLabel,
     QFrame, QStyle, QMenu, QMenuBar, QColorDialog, QDialog,
     QFormLayout, QLineEdit, QDialogButtonBox
 )
 from PyQt6.QtGui import QIcon, QGuiApplication, QAction, QColor
-from PyQt6.QtCore import Qt, QTimer
-
-# --- Comment Removal Logic ---
-
-class CommentRemoverLogic:
-    """
-    Class containing logic for removing comments for different languages.
-    NOTE: The regex-based system may have issues with comments inside
-    string literals (e.g., "this is not a #comment").
-    However, it is sufficient for most cases.
-    """
-    def __init__(self):
-        self.patterns = {
-            'Python': {
-                'single_line': r'#.*$',
-                'multi_line': r'(\"\"\"(.|\n)*?\"\"\")|(\'\'\'(.|\n)*?\'\'\')'
-            },
-            'C/C++/Java/C#/JavaScript/Rust': {
-                'single_line': r'//.*$',
-                'multi_line': r'/\*(.|\n)*?\*/'
-            },
-            'HTML/XML': {
-                'multi_line': r'<!--(.|\n)*?-->'
-            },
-            'SQL': {
-                'single_line': r'--.*$',
-                'multi_line': r'/\*(.|\n)*?\*/'
-            },
-            'Lua': {
-                'single_line': r'--.*$',
-                'multi_line': r'--\[\[(.|\n)*?\]\]'
-            }
-        }
-        # File extension to language mapping
-        self.extension_map = {
-            '.py': 'Python', '.pyw': 'Python',
-            '.c': 'C/C++/Java/C#/JavaScript/Rust', '.cpp': 'C/C++/Java/C#/JavaScript/Rust',
-            '.h': 'C/C++/Java/C#/JavaScript/Rust', '.hpp': 'C/C++/Java/C#/JavaScript/Rust',
-            '.java': 'C/C++/Java/C#/JavaScript/Rust', '.cs': 'C/C++/Java/C#/JavaScript/Rust',
-            '.js': 'C/C++/Java/C#/JavaScript/Rust', '.ts': 'C/C++/Java/C#/JavaScript/Rust',
-            '.rs': 'C/C++/Java/C#/JavaScript/Rust',
-            '.html': 'HTML/XML', '.htm': 'HTML/XML', '.xml': 'HTML/XML',
-            '.sql': 'SQL',
-            '.lua': 'Lua'
-        }
-
-    def get_language_from_filename(self, filename):
-        ext = os.path.splitext(filename)[1].lower()
-        return self.extension_map.get(ext, 'Python') # Domyślnie Python
-
-    def remove_comments(self, code, language):
-        if language not in self.patterns:
-            return code
-
-        patterns = self.patterns[language]
-        processed_code = code
-
-        if 'multi_line' in patterns:
-            processed_code = re.sub(patterns['multi_line'], '', processed_code)
-
-        if 'single_line' in patterns:
-            lines = processed_code.split('\n')
-            result_lines = []
-            for line in lines:
-                is_originally_empty = not line.strip()
-                cleaned_line = re.sub(patterns['single_line'], '', line)
-                
-                if cleaned_line.strip() or is_originally_empty:
-                    result_lines.append(cleaned_line)
-
-            processed_code = '\n'.join(result_lines)
-            
-        processed_code = re.sub(r'\n{3,}', '\n\n', processed_code)
-        
-        return processed_code.strip()
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
+from comment_logic import CommentRemoverLogic, LANGUAGES, LANGUAGE_IDS
 
 # --- Interfejs graficzny aplikacji ---
 
@@ -132,6 +59,7 @@ class ThemeManager:
         }
         self.current_theme = 'Dark'
         self.custom_colors = {}
+        self._stylesheet_cache = {}
 
     def get_theme(self, theme_name=None):
         if theme_name is None:
@@ -144,9 +72,21 @@ class ThemeManager:
             return True
         return False
 
+    def set_custom_theme(self, colors):
+        self.themes['Custom'] = colors
+        # A sheet built for the previous custom colors is stale now
+        self._stylesheet_cache.pop('Custom', None)
+        self.set_theme('Custom')
+
     def get_style_sheet(self, theme_name=None):
+        if theme_name is None:
+            theme_name = self.current_theme
+        cached = self._stylesheet_cache.get(theme_name)
+        if cached is not None:
+            return cached
+
         theme = self.get_theme(theme_name)
-        return f"""
+        style_sheet = f"""
         QWidget {{
             background-color: {theme['background']}; 
             color: {theme['text']};
@@ -154,7 +94,7 @@ class ThemeManager:
             font-size: 14px;
         }}
         QMainWindow {{ border: 1px solid {theme['border']}; }}
-        QTextEdit {{
+        QPlainTextEdit {{
             background-color: {theme['input_background']}; 
             color: {theme['text']};
             border: 1px solid {theme['border']}; 
@@ -218,6 +158,8 @@ class ThemeManager:
             background-color: {theme['accent']};
         }}
         """
+        self._stylesheet_cache[theme_name] = style_sheet
+        return style_sheet
 
 class ColorCustomizationDialog(QDialog):
     def __init__(self, parent=None, theme_manager=None):
@@ -261,13 +203,65 @@ class ColorCustomizationDialog(QDialog):
     def get_custom_colors(self):
         return {name: input.text() for name, input in self.color_inputs.items()}
 
+class _JobSignals(QObject):
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+class _FileLoadJob(QRunnable):
+    """
+    Reads a UTF-8 source file off the GUI thread. The file is memory-mapped
+    and decoded straight from the mapping, without an intermediate bytes copy.
+    """
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            with open(self.filename, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    content = ''
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, 'utf-8')
+            # Same newline handling as reading the file in text mode
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(content)
+
+class _StripJob(QRunnable):
+    def __init__(self, logic, code, language):
+        super().__init__()
+        self.logic = logic
+        self.code = code
+        self.language = language
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            processed_code = self.logic.remove_comments(self.code, self.language)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(processed_code)
+
 class CommentRemoverApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.logic = CommentRemoverLogic()
         self.theme_manager = ThemeManager()
         self.current_filepath = None
+        self.pending_filepath = None
         self.loading_file = False
+        self._last_output = ''
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(150)
+        self._dirty_timer.timeout.connect(self.reset_filepath_on_manual_edit)
         self.init_ui()
         self.init_menu()
 
@@ -297,8 +291,7 @@ class CommentRemoverApp(QMainWindow):
         dialog = ColorCustomizationDialog(self, self.theme_manager)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             custom_colors = dialog.get_custom_colors()
-            self.theme_manager.themes['Custom'] = custom_colors
-            self.theme_manager.set_theme('Custom')
+            self.theme_manager.set_custom_theme(custom_colors)
             self.setStyleSheet(self.theme_manager.get_style_sheet())
             self.update_status("Custom colors applied")
 
@@ -315,7 +308,7 @@ class CommentRemoverApp(QMainWindow):
         top_panel_layout = QHBoxLayout()
 
         self.lang_combo = QComboBox()
-        self.lang_combo.addItems(self.logic.patterns.keys())
+        self.lang_combo.addItems(LANGUAGES)
         self.lang_combo.setToolTip("Select programming language")
         top_panel_layout.addWidget(QLabel("Language:"))
         top_panel_layout.addWidget(self.lang_combo, 1)
@@ -337,18 +330,19 @@ class CommentRemoverApp(QMainWindow):
 
         input_layout = QVBoxLayout()
         input_label = QLabel("Input Code (paste here or select file)")
-        self.text_input = QTextEdit()
+        self.text_input = QPlainTextEdit()
         self.text_input.setPlaceholderText("Paste your code here...")
         
-        self.text_input.textChanged.connect(self.reset_filepath_on_manual_edit)
+        self.text_input.textChanged.connect(self.on_input_changed)
 
         input_layout.addWidget(input_label)
         input_layout.addWidget(self.text_input)
 
         output_layout = QVBoxLayout()
         output_label = QLabel("Output Code (without comments)")
-        self.text_output = QTextEdit()
+        self.text_output = QPlainTextEdit()
         self.text_output.setReadOnly(True)
+        self.text_output.setUndoRedoEnabled(False)
         output_layout.addWidget(output_label)
         output_layout.addWidget(self.text_output)
 
@@ -385,6 +379,12 @@ class CommentRemoverApp(QMainWindow):
         
         self.setStyleSheet(self.theme_manager.get_style_sheet())
 
+    def on_input_changed(self):
+        # Nothing to reset unless the text still comes from a loaded file
+        if self.loading_file or self.current_filepath is None:
+            return
+        self._dirty_timer.start()
+
     def reset_filepath_on_manual_edit(self):
         if not self.loading_file:
             self.current_filepath = None
@@ -394,24 +394,43 @@ class CommentRemoverApp(QMainWindow):
         filename, _ = QFileDialog.getOpenFileName(self, "Open Code File", "", file_filters)
         
         if filename:
-            try:
-                self.loading_file = True
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.text_input.setPlainText(content)
-                self.current_filepath = filename
-                self.update_status(f"File loaded: {os.path.basename(filename)}")
-                lang = self.logic.get_language_from_filename(filename)
-                self.lang_combo.setCurrentText(lang)
-            except Exception as e:
-                self.text_input.setPlainText(f"Error reading file: {e}")
-                self.update_status("Error reading file.", is_error=True)
-                self.current_filepath = None
-            finally:
-                self.loading_file = False
+            self.pending_filepath = filename
+            self.btn_open.setEnabled(False)
+            self.update_status(f"Loading file: {os.path.basename(filename)}...")
+
+            job = _FileLoadJob(filename)
+            job.signals.finished.connect(self.on_file_loaded)
+            job.signals.failed.connect(self.on_file_load_failed)
+            QThreadPool.globalInstance().start(job)
+
+    def on_file_loaded(self, content):
+        filename = self.pending_filepath
+        self._dirty_timer.stop()
+        try:
+            self.loading_file = True
+            self.text_input.setPlainText(content)
+            self.current_filepath = filename
+            self.update_status(f"File loaded: {os.path.basename(filename)}")
+            lang = self.logic.get_language_from_filename(filename)
+            self.lang_combo.setCurrentText(LANGUAGES[lang])
+        finally:
+            self.loading_file = False
+            self.pending_filepath = None
+            self.btn_open.setEnabled(True)
+
+    def on_file_load_failed(self, error):
+        try:
+            self.loading_file = True
+            self.text_input.setPlainText(f"Error reading file: {error}")
+            self.update_status("Error reading file.", is_error=True)
+            self.current_filepath = None
+        finally:
+            self.loading_file = False
+            self.pending_filepath = None
+            self.btn_open.setEnabled(True)
 
     def save_file_dialog(self):
-        output_code = self.text_output.toPlainText()
+        output_code = self._last_output
         if not output_code:
             self.update_status("No code to save.", is_error=True)
             return
@@ -427,8 +446,12 @@ class CommentRemoverApp(QMainWindow):
 
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(output_code)
+                # Keep the platform line endings a text-mode write would produce
+                if os.linesep != '\n':
+                    output_code = output_code.replace('\n', os.linesep)
+                data = output_code.encode('utf-8')
+                with open(filename, 'wb') as f:
+                    f.write(data)
                 self.update_status(f"File saved: {os.path.basename(filename)}")
             except Exception as e:
                 self.update_status(f"Error saving file: {e}", is_error=True)
@@ -439,19 +462,29 @@ class CommentRemoverApp(QMainWindow):
             self.update_status("No code to process.", is_error=True)
             return
 
-        language = self.lang_combo.currentText()
+        language = LANGUAGE_IDS[self.lang_combo.currentText()]
         
+        self.btn_process.setEnabled(False)
         self.update_status("Processing...", is_error=False)
-        QApplication.processEvents()
 
-        processed_code = self.logic.remove_comments(input_code, language)
+        job = _StripJob(self.logic, input_code, language)
+        job.signals.finished.connect(self.on_code_processed)
+        job.signals.failed.connect(self.on_code_process_failed)
+        QThreadPool.globalInstance().start(job)
+
+    def on_code_processed(self, processed_code):
+        self._last_output = processed_code
         self.text_output.setPlainText(processed_code)
-        
+        self.btn_process.setEnabled(True)
         self.update_status("Comments removed successfully.", is_error=False)
 
+    def on_code_process_failed(self, error):
+        self.btn_process.setEnabled(True)
+        self.update_status(f"Error removing comments: {error}", is_error=True)
+
     def copy_to_clipboard(self):
         clipboard = QGuiApplication.clipboard()
-        text_to_copy = self.text_output.toPlainText()
+        text_to_copy = self._last_output
         if text_to_copy:
             clipboard.setText(text_to_copy)
             self.btn_copy.setText("Copied!")
@@ -0,0 +1,55 @@
+# strip_cli.py
+import sys
+import os
+import argparse
+
+from comment_logic import CommentRemoverLogic, LANGUAGES, LANGUAGE_IDS
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Remove comments from source files without starting the GUI."
+    )
+    parser.add_argument('files', nargs='+', help="Source files to process")
+    parser.add_argument(
+        '-l', '--language', choices=LANGUAGES,
+        help="Language of all files (default: detected from each file extension)"
+    )
+    parser.add_argument(
+        '-i', '--in-place', action='store_true',
+        help="Overwrite the files instead of writing <name>_nocomments<ext> next to them"
+    )
+    return parser.parse_args(argv)
+
+def output_path(filepath, in_place):
+    if in_place:
+        return filepath
+    base, ext = os.path.splitext(filepath)
+    return f"{base}_nocomments{ext}"
+
+def main(argv=None):
+    args = parse_args(argv)
+    logic = CommentRemoverLogic()
+    failed = False
+
+    for filepath in args.files:
+        if args.language:
+            language = LANGUAGE_IDS[args.language]
+        else:
+            language = logic.get_language_from_filename(filepath)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                code = f.read()
+            processed_code = logic.remove_comments(code, language)
+            target = output_path(filepath, args.in_place)
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(processed_code)
+        except Exception as e:
+            print(f"Error processing {filepath}: {e}", file=sys.stderr)
+            failed = True
+        else:
+            print(f"{filepath} -> {target} ({LANGUAGES[language]})")
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# test_comment_logic.py
+import unittest
+
+from comment_logic import CommentRemoverLogic, Lang
+
+class ScannerTest(unittest.TestCase):
+    def setUp(self):
+        self.logic = CommentRemoverLogic()
+
+    def strip(self, code, language):
+        return self.logic.remove_comments(code, language)
+
+    def test_rust_lifetimes_are_not_strings(self):
+        code = "fn f<'a>(x: &'a str) -> &'a str { // lifetime\n    x // ret\n}"
+        self.assertEqual(self.strip(code, Lang.C_LIKE),
+                         "fn f<'a>(x: &'a str) -> &'a str {\n    x\n}")
+
+    def test_quote_in_js_regex_literal(self):
+        self.assertEqual(self.strip("var r = /'/; // c\nx", Lang.C_LIKE), "var r = /'/;\nx")
+
+    def test_char_literals(self):
+        code = "char a = '/'; // c\nchar b = '\\''; // c\nchar d = '\\x2F'; // c"
+        self.assertEqual(self.strip(code, Lang.C_LIKE),
+                         "char a = '/';\nchar b = '\\'';\nchar d = '\\x2F';")
+
+    def test_js_single_quoted_strings_are_not_protected(self):
+        # Known limitation: ' only opens char literals, see CommentRemoverLogic
+        self.assertEqual(self.strip("var s = 'http://x'; // c", Lang.C_LIKE), "var s = 'http:")
+        self.assertEqual(self.strip("var t = 'a /* b'; x(); // */ y", Lang.C_LIKE), "var t = 'a  y")
+
+    def test_markers_inside_strings_are_kept(self):
+        self.assertEqual(self.strip('s = "http://x /* y */"; // c', Lang.C_LIKE),
+                         's = "http://x /* y */";')
+        self.assertEqual(self.strip('t = `a\n// in template\n`; // c', Lang.C_LIKE),
+                         't = `a\n// in template\n`;')
+        self.assertEqual(self.strip("s = '# no'  # yes\nt = \"# no\"", Lang.PYTHON),
+                         "s = '# no'\nt = \"# no\"")
+
+    def test_comment_only_lines_are_dropped(self):
+        code = "x = 1\n    # only a comment\n\ny = 2  # trailing\n# last"
+        self.assertEqual(self.strip(code, Lang.PYTHON), "x = 1\n\ny = 2")
+        code = "int a;\n  // one\n/* two */ // three\nint b;"
+        self.assertEqual(self.strip(code, Lang.C_LIKE), "int a;\nint b;")
+
+    def test_block_comments(self):
+        self.assertEqual(self.strip('def f():\n    """Doc."""\n    return 1', Lang.PYTHON),
+                         'def f():\n    \n    return 1')
+        self.assertEqual(self.strip('int a; /* multi\nline */ int b;', Lang.C_LIKE), 'int a;  int b;')
+        self.assertEqual(self.strip('/* open', Lang.C_LIKE), '/* open')
+
+    def test_blanks_before_trailing_comment_are_trimmed(self):
+        self.assertEqual(self.strip('a /* x */ // y\nb', Lang.C_LIKE), 'a\nb')
+        self.assertEqual(self.strip('a = 1 \t# c\nb', Lang.PYTHON), 'a = 1\nb')
+
+    def test_html(self):
+        self.assertEqual(self.strip('<a><!-- c --></a>\n<!-- x\n y -->\n\n\n\n<b/>', Lang.HTML),
+                         '<a></a>\n\n<b/>')
+
+class PatternPathTest(unittest.TestCase):
+    def setUp(self):
+        self.logic = CommentRemoverLogic()
+
+    def strip(self, code, language):
+        return self.logic.remove_comments(code, language)
+
+    def test_comment_only_lines_are_dropped(self):
+        self.assertEqual(self.strip('-- c\nSELECT 1\n  -- only\nFROM t', Lang.SQL), 'SELECT 1\nFROM t')
+        self.assertEqual(self.strip('-- c\nx = 1\n  -- only\ny = 2', Lang.LUA), 'x = 1\ny = 2')
+        # Same line structure as the scanner when a block comment comes first
+        self.assertEqual(self.strip('a\n/* x */ -- y\nb', Lang.SQL), 'a\nb')
+        self.assertEqual(self.strip('a\n--[[ x ]] -- y\nb', Lang.LUA), 'a\nb')
+
+    def test_blanks_before_trailing_comment_are_trimmed(self):
+        self.assertEqual(self.strip('SELECT 1  -- c\nFROM t', Lang.SQL), 'SELECT 1\nFROM t')
+        self.assertEqual(self.strip('SELECT 1 /* x */ -- c\nFROM t', Lang.SQL), 'SELECT 1\nFROM t')
+        self.assertEqual(self.strip('x = 1\t-- c\ny = 2', Lang.LUA), 'x = 1\ny = 2')
+        self.assertEqual(self.strip('x = 1 --[[ a ]] -- c\ny = 2', Lang.LUA), 'x = 1\ny = 2')
+
+    def test_sql_block_comments(self):
+        self.assertEqual(self.strip('SELECT /* a\nb */ 1 /**/ FROM t', Lang.SQL), 'SELECT  1  FROM t')
+
+    def test_lua_block_comments(self):
+        self.assertEqual(self.strip('x --[[c]] y', Lang.LUA), 'x  y')
+        # Unterminated block falls back to a line comment
+        self.assertEqual(self.strip('x = 1 --[[ open\ny = 2', Lang.LUA), 'x = 1\ny = 2')
+        # ---[[ is a line comment, not a block start
+        self.assertEqual(self.strip('x = 1 ---[[ c\ny = 2 -- ]]', Lang.LUA), 'x = 1\ny = 2')
+
+if __name__ == '__main__':
+    unittest.main()